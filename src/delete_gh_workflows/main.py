@@ -1,6 +1,13 @@
+from operator import itemgetter
 import click
 from src.delete_gh_workflows.workflowManager import GitHubWorkflowManager
 
+# Menu labels for (workflow_id, workflow_name) and (run_id, run_name, created_at, status) tuples,
+# taking the whole tuple as their only argument so they can be mapped over the listings directly
+_WORKFLOW_LABEL = "{0[1]} (ID: {0[0]})".format
+_RUN_LABEL = "{0[1]} - Created: {0[2]} - Status: {0[3]} (ID: {0[0]})".format
+_id = itemgetter(0)
+
 @click.command()
 def manage_workflow_runs():
     """
@@ -23,71 +30,78 @@ def manage_workflow_runs():
         click.echo("Could not determine repository. Ensure you're in a GitHub repo directory.")
         return
 
-    while True:
-        # Fetch and display available workflows
-        click.echo(f"\nFetching workflows for repository '{manager.repo}'...")
-        workflows = manager.list_workflows()
-        if not workflows:
-            click.echo("No workflows found.")
-            return
+    # Always cancel background prefetches, however the loop is left (including Ctrl-C)
+    try:
+        refresh_workflows = False
+        while True:
+            # Fetch and display available workflows, reusing the previous listing unless a refresh was requested
+            click.echo(f"\nFetching workflows for repository '{manager.repo}'...")
+            workflows = manager.list_workflows(refresh=refresh_workflows)
+            refresh_workflows = False
+            if not workflows:
+                click.echo("No workflows found.")
+                return
 
-        # Present workflows in a selectable menu
-        workflow_choices = [f"{workflow[1]} (ID: {workflow[0]})" for workflow in workflows] + ["Exit"]
-        selected_workflow = manager.run_fzf_selection(workflow_choices, "Select a workflow")
+            # Present workflows in a selectable menu
+            workflow_choice_to_id = dict(zip(map(_WORKFLOW_LABEL, workflows), map(_id, workflows)))
+            workflow_choices = list(workflow_choice_to_id) + ["Refresh", "Exit"]
+            manager.prefetch_workflow_runs(workflow_choice_to_id.values())
+            selected_workflow = manager.run_fzf_selection(workflow_choices, "Select a workflow")
 
-        # Exit if the user chooses to
-        if "Exit" in selected_workflow:
-            click.echo("Exiting without selecting any workflow.")
-            return
+            # Exit if the user chooses to
+            if "Exit" in selected_workflow:
+                click.echo("Exiting without selecting any workflow.")
+                return
 
-        # Retrieve the ID and name of the selected workflow
-        selected_workflow_name = selected_workflow[0]
-        selected_workflow_id = next(w[0] for w in workflows if f"{w[1]} (ID: {w[0]})" == selected_workflow_name)
+            # Handle "Refresh" option to fetch the workflows again
+            if "Refresh" in selected_workflow:
+                refresh_workflows = True
+                continue
 
-        while True:
-            # Fetch and display workflow runs for the selected workflow
-            click.echo(f"\nFetching runs for workflow '{selected_workflow_name}'...")
-            runs = manager.list_workflow_runs(selected_workflow_id)
-            if not runs:
-                click.echo("No workflow runs found.")
-                break
-
-            # Sort and display workflow runs
-            runs.sort(key=lambda x: x[1].lower())
-            run_choices = [
-                f"{run[1]} - Created: {run[2]} - Status: {run[3]} (ID: {run[0]})" for run in runs
-            ] + ["Delete All Runs", "Back"]
-            selected_runs = manager.run_fzf_selection(run_choices, "Select workflow runs to delete")
-
-            # Handle "Back" option to return to workflow selection
-            if "Back" in selected_runs:
-                click.echo("Returning to workflow selection.")
-                break
-
-            # Handle "Delete All Runs" option
-            if "Delete All Runs" in selected_runs:
-                delete_choice = click.prompt("Delete all runs? (y/n)", type=str)
-                if delete_choice.lower() == 'y':
-                    manager.delete_all_runs(selected_workflow_id)
-
-            elif selected_runs:
-                # Provide feedback on how many runs are selected
-                selected_run_count = len(selected_runs)
-                delete_choice = click.prompt(
-                    f"\nYou have selected {selected_run_count} run(s). Do you want to delete these? (y/n)",
-                    type=str
-                )
-
-                # Delete selected runs if confirmed
-                if delete_choice.lower() == 'y':
-                    for run_id in [int(run.split("(ID: ")[1][:-1]) for run in selected_runs]:
-                        if manager.delete_workflow_run(run_id):
-                            click.echo(f"Deleted workflow run ID {run_id}.")
-                        else:
-                            click.echo(f"Failed to delete workflow run ID {run_id}.")
-            else:
-                # Inform the user if no runs are selected
-                click.echo("No runs selected. Exiting.")
+            # Retrieve the ID and name of the selected workflow
+            selected_workflow_name = selected_workflow[0]
+            selected_workflow_id = workflow_choice_to_id[selected_workflow_name]
+
+            while True:
+                # Fetch and display workflow runs for the selected workflow
+                click.echo(f"\nFetching runs for workflow '{selected_workflow_name}'...")
+                runs = manager.list_workflow_runs(selected_workflow_id)
+                if not runs:
+                    click.echo("No workflow runs found.")
+                    break
+
+                # Display workflow runs, which are already sorted by name
+                run_choice_to_id = dict(zip(map(_RUN_LABEL, runs), map(_id, runs)))
+                run_choices = list(run_choice_to_id) + ["Delete All Runs", "Back"]
+                selected_runs = manager.run_fzf_selection(run_choices, "Select workflow runs to delete")
+
+                # Handle "Back" option to return to workflow selection
+                if "Back" in selected_runs:
+                    click.echo("Returning to workflow selection.")
+                    break
+
+                # Handle "Delete All Runs" option
+                if "Delete All Runs" in selected_runs:
+                    delete_choice = click.prompt("Delete all runs? (y/n)", type=str)
+                    if delete_choice.lower() == 'y':
+                        manager.delete_all_runs(selected_workflow_id)
+
+                elif selected_runs:
+                    # Provide feedback on how many runs are selected
+                    selected_run_count = len(selected_runs)
+                    delete_choice = click.prompt(
+                        f"\nYou have selected {selected_run_count} run(s). Do you want to delete these? (y/n)",
+                        type=str
+                    )
+
+                    # Delete selected runs if confirmed
+                    if delete_choice.lower() == 'y':
+                        manager.delete_workflow_runs([run_choice_to_id[run] for run in selected_runs if run in run_choice_to_id])
+                else:
+                    # Inform the user if no runs are selected
+                    click.echo("No runs selected. Exiting.")
+    finally:
+        manager.close()
 
 if __name__ == "__main__":
     manage_workflow_runs()
@@ -1,8 +1,120 @@
-import requests
+import configparser
+import functools
+import os
+import re
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 import click
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the decoder bundled with requests is used without it
+    orjson = None
+
+# Number of concurrent requests issued when fetching pages or removing runs in bulk
+MAX_WORKERS = 16
+
+# Number of times a request rejected by GitHub's rate limit is repeated after waiting for the limit to reset
+RATE_LIMIT_RETRIES = 3
+
+# Seconds to wait after a secondary rate limit that does not say how long to wait, as recommended by GitHub
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+# Number of workflows whose first page of runs is fetched at a time while the user picks a workflow
+PREFETCH_WORKERS = 4
+
+# Location and lifetime of the cached GitHub token, which saves spawning the GitHub CLI on every invocation
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "delete_gh_workflows"
+TOKEN_CACHE_TTL = 55 * 60
+
+# Environment variables from which the GitHub CLI takes its token instead of the logged in account
+TOKEN_ENV_VARS = ("GH_TOKEN", "GITHUB_TOKEN")
+
+# Seconds to wait for non-interactive GitHub CLI calls before giving up
+GH_TIMEOUT = 10
+
+# Seconds for which the runs of a workflow are reused when the same workflow is selected again
+RUNS_CACHE_TTL = 30.0
+
+# Seconds after which the workflow list is fetched again even without an explicit refresh
+WORKFLOWS_CACHE_TTL = 300.0
+
+# Maximum number of responses kept for conditional requests; the least recently used ones are dropped first
+ETAG_CACHE_SIZE = 256
+
+# Extracts "owner/repo" from HTTPS (https://github.com/owner/repo.git) and SSH (git@github.com:owner/repo.git) remotes
+_REPO_RE = re.compile(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$")
+
+# Build the (id, name, ...) tuples returned by the listings directly from the decoded JSON objects
+_workflow_row = itemgetter("id", "name")
+_run_row = itemgetter("id", "name", "created_at", "status")
+
+
+def _decode_json(response):
+    """
+    Decodes the JSON body of a response, using orjson when it is installed.
+
+    Args:
+        response (requests.Response): The response to decode.
+
+    Returns:
+        dict: The decoded JSON body.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _parse_runs_page(response):
+    """
+    Extracts the page count and the run tuples from a page of the workflow runs endpoint.
+
+    Args:
+        response (requests.Response): The response for one page of workflow runs.
+
+    Returns:
+        tuple: The number of the last page and a list of (run_id, run_name, created_at, status) tuples.
+    """
+    # GitHub announces the last page in the Link header; it is missing if there is only one page
+    last_url = response.links.get("last", {}).get("url")
+    last_page = int(parse_qs(urlparse(last_url).query)["page"][0]) if last_url else 1
+    return last_page, list(map(_run_row, _decode_json(response)["workflow_runs"]))
+
+
+def _token_cache_key():
+    """
+    Identifies the GitHub CLI account a cached token belongs to.
+
+    The GitHub CLI rewrites its hosts.yml on every login, logout and 'gh auth switch', so its modification
+    time and size change whenever the active account does.
+
+    Returns:
+        str: The key stored next to the cached token.
+        None: If the token comes from an environment variable and must not be cached.
+    """
+    if any(os.environ.get(name) for name in TOKEN_ENV_VARS):
+        return None
+    if os.environ.get("GH_CONFIG_DIR"):
+        config_dir = Path(os.environ["GH_CONFIG_DIR"])
+    elif os.environ.get("XDG_CONFIG_HOME"):
+        config_dir = Path(os.environ["XDG_CONFIG_HOME"]) / "gh"
+    elif os.name == "nt" and os.environ.get("AppData"):
+        config_dir = Path(os.environ["AppData"]) / "GitHub CLI"
+    else:
+        config_dir = Path("~/.config/gh").expanduser()
+    try:
+        stat = (config_dir / "hosts.yml").stat()
+    except OSError:
+        return "-"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
 class GitHubWorkflowManager:
     """
     A class to manage GitHub Actions workflows and runs via the GitHub API and CLI.
@@ -11,6 +123,7 @@ class GitHubWorkflowManager:
         github_api_url (str): The base URL for the GitHub API. Defaults to "https://api.github.com".
         repo (str): The repository identifier in the format "owner/repo".
         token (str): The GitHub token used for API authentication.
+        session (requests.Session): The pooled HTTP session, created on first use.
     """
 
     def __init__(self, github_api_url: str = "https://api.github.com"):
@@ -23,6 +136,19 @@ class GitHubWorkflowManager:
         self.repo = self.__get_repo_info()
         self.token = self.__get_gh_token()
         self.github_api_url = github_api_url
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._rate_limited_until = 0.0
+        self._rate_limit_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._token_lock = threading.Lock()
+        self._token_refreshed = False
+        self._runs_cache = {}
+        self._workflows_cache = None
+        self._prefetch = {}
+        self._prefetch_executor = None
+        self._actions_url = f"{github_api_url}/repos/{self.repo}/actions"
+        self._workflows_url = f"{self._actions_url}/workflows"
 
     def __get_repo_info(self):
         """
@@ -34,13 +160,22 @@ class GitHubWorkflowManager:
         """
         try:
             git_path = Path(".git").resolve()
-            with open(git_path / "config") as f:
-                lines = f.readlines()
-            for line in lines:
-                if line.strip().startswith("url = "):
-                    url = line.split("=", 1)[1].strip()
-                    repo_path = url.split("github.com/")[1].replace(".git", "")
-                    return repo_path
+            # Git allows repeated keys (e.g. several fetch refspecs), valueless boolean keys, inline
+            # comments and literal '%' characters in values
+            config = configparser.ConfigParser(
+                strict=False, interpolation=None, allow_no_value=True, inline_comment_prefixes=("#", ";")
+            )
+            config.read(git_path / "config")
+            url = config.get('remote "origin"', "url", fallback=None)
+            if url is None:
+                click.echo("No 'origin' remote found in the Git configuration.")
+                return None
+
+            match = _REPO_RE.search(url)
+            if match is None:
+                click.echo(f"The 'origin' remote '{url}' does not point to a GitHub repository.")
+                return None
+            return match.group(1)
         except Exception as e:
             click.echo(f"Error retrieving repo info: {e}")
             return None
@@ -53,39 +188,290 @@ class GitHubWorkflowManager:
             str: The GitHub token if successfully retrieved.
             None: If the token cannot be retrieved or the CLI is not installed.
         """
+        token = self.__read_cached_token()
+        if token:
+            return token
+
         try:
-            result = subprocess.run(['gh', 'auth', 'status'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True, timeout=GH_TIMEOUT)
             if result.returncode != 0:
                 click.echo("You are not authenticated with GitHub CLI. Initiating login process...")
                 subprocess.run(['gh', 'auth', 'login'], check=True)
-            
-            result = subprocess.run(['gh', 'auth', 'token'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True, timeout=GH_TIMEOUT)
+
             if result.returncode == 0:
-                return result.stdout.decode('utf-8').strip()
+                token = result.stdout.strip()
+                self.__write_cached_token(token)
+                return token
             else:
                 click.echo("Failed to retrieve GitHub token.")
                 return None
         except FileNotFoundError:
             click.echo("GitHub CLI ('gh') is not installed. Please install it to authenticate.")
             return None
+        except subprocess.TimeoutExpired:
+            click.echo("Timed out while retrieving the GitHub token from the GitHub CLI.")
+            return None
+
+    def __read_cached_token(self):
+        """
+        Reads the GitHub token from the on-disk cache if it has not expired yet and belongs to the active account.
+
+        Returns:
+            str: The cached GitHub token.
+            None: If no cached token exists, it is older than TOKEN_CACHE_TTL seconds, it was cached for another
+                account or the token is set in the environment.
+        """
+        key = _token_cache_key()
+        if key is None:
+            return None
+        token_path = CACHE_DIR / "token"
+        try:
+            if token_path.stat().st_mtime > time.time() - TOKEN_CACHE_TTL:
+                cached_key, _, token = token_path.read_text().partition("\n")
+                if cached_key == key:
+                    return token.strip() or None
+        except OSError:
+            pass
+        return None
+
+    def __write_cached_token(self, token):
+        """
+        Stores the GitHub token in the on-disk cache, readable by the current user only.
+
+        Tokens set in the environment are not cached, so that changing the variable takes effect right away.
+
+        Args:
+            token (str): The GitHub token to cache.
+        """
+        key = _token_cache_key()
+        if key is None:
+            return
+        try:
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            token_path = CACHE_DIR / "token"
+            fd = os.open(token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write(f"{key}\n{token}")
+            os.chmod(token_path, 0o600)
+        except OSError as e:
+            click.echo(f"Could not cache GitHub token: {e}")
+
+    @functools.cached_property
+    def session(self):
+        """
+        Creates a pooled HTTP session that is shared across all API calls.
+
+        The session keeps connections alive between requests, carries the authorization header and
+        retries requests that fail due to gateway errors. Rate limits are handled by `__request`.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        # requests and urllib3 are only imported once the API is used, which keeps startup fast
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET", "DELETE"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
+
+    def __request(self, method, url, retry_rate_limited=True, **kwargs):
+        """
+        Sends a request on the shared session while respecting GitHub's rate limits.
+
+        Once a response reports an exhausted rate limit, every request waits until the limit resets
+        (or for the duration given by Retry-After) instead of being sent only to be rejected, and
+        requests rejected by the rate limit are repeated after the wait.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            retry_rate_limited (bool): Whether to wait for and repeat rate limited requests. Defaults to True.
+            **kwargs: Additional arguments passed to `requests.Session.request`.
 
-    def list_workflows(self):
+        Returns:
+            requests.Response: The response of the last attempt.
+
+        Raises:
+            RuntimeError: If the manager is closed while the request waits for the rate limit to reset.
+        """
+        for _ in range(RATE_LIMIT_RETRIES + 1):
+            delay = max(0, self._rate_limited_until - time.time()) if retry_rate_limited else 0
+            # Waiting on the close event lets `close` end a wait that can last until the rate limit resets
+            if self._closed.wait(delay):
+                raise RuntimeError("The GitHubWorkflowManager was closed while waiting for the rate limit.")
+
+            token = self.token
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code == 401 and self.__refresh_token(token):
+                response = self.session.request(method, url, **kwargs)
+            if not self.__track_rate_limit(response) or not retry_rate_limited:
+                break
+        return response
+
+    def __refresh_token(self, rejected_token):
+        """
+        Replaces a token rejected by GitHub, e.g. after 'gh auth logout' or a revocation.
+
+        The cached token is discarded and a fresh one is requested from the GitHub CLI. This happens at
+        most once per manager so that a token the CLI keeps returning is not fetched over and over. Since
+        it runs in worker threads, the CLI is never asked to log in interactively; if it has no token,
+        the rejected one is kept.
+
+        Args:
+            rejected_token (str): The token that was sent with the rejected request.
+
+        Returns:
+            bool: True if a different token is now in use and the request should be repeated.
+        """
+        with self._token_lock:
+            if not self._token_refreshed and self.token == rejected_token:
+                self._token_refreshed = True
+                try:
+                    (CACHE_DIR / "token").unlink()
+                except OSError:
+                    pass
+                try:
+                    result = subprocess.run(
+                        ['gh', 'auth', 'token'], capture_output=True, text=True, timeout=GH_TIMEOUT
+                    )
+                except (OSError, subprocess.SubprocessError):
+                    result = None
+                token = result.stdout.strip() if result is not None and result.returncode == 0 else ""
+                if token:
+                    self.__write_cached_token(token)
+                    self.token = token
+                    self.session.headers["Authorization"] = f"Bearer {token}"
+            return self.token != rejected_token
+
+    def __track_rate_limit(self, response):
+        """
+        Records until when requests have to wait, based on the rate limit headers of a response.
+
+        Args:
+            response (requests.Response): The response to inspect.
+
+        Returns:
+            bool: True if the request was rejected by a rate limit and should be repeated after the wait.
+        """
+        from urllib3.util.retry import Retry
+
+        headers = response.headers
+        now = time.time()
+        retry_after = headers.get("Retry-After")
+        exhausted = headers.get("X-RateLimit-Remaining") == "0"
+        # A 403 is also returned for missing permissions, which must not be waited for
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403 and (retry_after or exhausted or "rate limit" in response.text.lower())
+        )
+
+        if rate_limited and retry_after:
+            # Secondary rate limits ask to wait a number of seconds, or until an HTTP date
+            try:
+                until = now + Retry(0).parse_retry_after(retry_after)
+            except Exception:
+                until = now + SECONDARY_RATE_LIMIT_WAIT
+        elif exhausted:
+            # The primary rate limit is exhausted until the reset time given as epoch seconds
+            try:
+                until = int(headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                until = now + SECONDARY_RATE_LIMIT_WAIT
+        elif rate_limited:
+            until = now + SECONDARY_RATE_LIMIT_WAIT
+        else:
+            return False
+
+        with self._rate_limit_lock:
+            already_waiting = self._rate_limited_until > now
+            self._rate_limited_until = max(self._rate_limited_until, until)
+
+        # Announce a wait once when it begins instead of from every worker thread that runs into it
+        if not already_waiting and until > now:
+            click.echo(f"\nGitHub rate limit reached, waiting {until - now:.0f}s before continuing...")
+        return bool(rate_limited)
+
+    def __conditional_get(self, key, url, parse, params=None, retry_rate_limited=True):
+        """
+        Performs a GET request that is answered from the ETag cache when GitHub reports no changes.
+
+        Conditional requests answered with 304 Not Modified carry no body and do not count against
+        the rate limit, so unchanged listings are reused instead of being downloaded and parsed again.
+
+        Args:
+            key (hashable): The cache key identifying the requested resource.
+            url (str): The URL to request.
+            parse (callable): Converts the successful response into the value that is cached and returned.
+            params (dict): Optional query parameters for the request.
+            retry_rate_limited (bool): Whether to wait for and repeat rate limited requests. Defaults to True.
+
+        Returns:
+            tuple: The response and the parsed value, or None as value if the request failed.
+        """
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached:
+                self._etag_cache.move_to_end(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.__request("GET", url, retry_rate_limited=retry_rate_limited, params=params, headers=headers)
+        if response.status_code == 304:
+            return response, cached[1]
+        if response.status_code != 200:
+            return response, None
+
+        value = parse(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, value)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return response, value
+
+    def list_workflows(self, refresh=False):
         """
         Lists all workflows for the current repository.
 
+        The workflows are reused for WORKFLOWS_CACHE_TTL seconds unless a refresh is requested.
+
+        Args:
+            refresh (bool): Whether to fetch the workflows again instead of using the cached list. Defaults to False.
+
         Returns:
             list: A list of tuples containing workflow ID and name.
                   Example: [(workflow_id, workflow_name), ...]
             list: An empty list if no workflows are found or if the request fails.
         """
-        headers = {"Authorization": f"Bearer {self.token}"}
-        url = f"{self.github_api_url}/repos/{self.repo}/actions/workflows"
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
+        cached = self._workflows_cache
+        if cached is not None and not refresh and time.monotonic() - cached[0] < WORKFLOWS_CACHE_TTL:
+            return list(cached[1])
+
+        response, workflows = self.__conditional_get(
+            "workflows",
+            self._workflows_url,
+            lambda response: list(map(_workflow_row, _decode_json(response)["workflows"])),
+        )
+        if workflows is None:
             click.echo(f"Failed to fetch workflows: {response.text}")
             return []
-        workflows = response.json()["workflows"]
-        return [(workflow["id"], workflow["name"]) for workflow in workflows]
+        self._workflows_cache = (time.monotonic(), workflows)
+        return list(workflows)
 
     def list_workflow_runs(self, workflow_id):
         """
@@ -95,29 +481,146 @@ class GitHubWorkflowManager:
             workflow_id (int): The ID of the workflow.
 
         Returns:
-            list: A list of tuples containing run ID, name, creation date, and status.
+            list: A list of tuples containing run ID, name, creation date, and status, sorted by name.
                   Example: [(run_id, run_name, created_at, status), ...]
         """
-        headers = {"Authorization": f"Bearer {self.token}"}
-        runs = []
-        page = 1
-        per_page = 100
+        # A running prefetch is waited for and its first page reused; one still queued behind other
+        # workflows is cancelled and the runs are fetched directly instead
+        future = self._prefetch.pop(workflow_id, None)
+        prefetched = None
+        if future is not None and not future.cancel():
+            prefetched = future.result()
+        return self.__fetch_workflow_runs(workflow_id, prefetched)
+
+    def prefetch_workflow_runs(self, workflow_ids):
+        """
+        Starts fetching the first page of runs of the given workflows in the background.
 
-        while True:
-            url = f"{self.github_api_url}/repos/{self.repo}/actions/workflows/{workflow_id}/runs"
-            response = requests.get(url, headers=headers, params={"per_page": per_page, "page": page})
-            if response.status_code != 200:
+        This overlaps the network requests with the time the user spends picking a workflow; the first
+        page is picked up by `list_workflow_runs`, which covers the whole listing of most workflows.
+        Only PREFETCH_WORKERS requests are in flight at a time, and workflows with a fresh listing or
+        prefetch are skipped, so revisiting the menu does not request them again. Nothing is prefetched
+        while a rate limit is in effect.
+
+        Args:
+            workflow_ids (iterable): The IDs of the workflows whose runs should be fetched.
+        """
+        if self._closed.is_set() or self._rate_limited_until > time.time():
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+        for workflow_id in workflow_ids:
+            cached = self._runs_cache.get(workflow_id)
+            if cached and time.monotonic() - cached[0] < RUNS_CACHE_TTL:
+                continue
+            future = self._prefetch.get(workflow_id)
+            if future is not None:
+                if not future.done():
+                    continue
+                prefetched = future.result()
+                if prefetched is not None and time.monotonic() - prefetched[0] < RUNS_CACHE_TTL:
+                    continue
+            self._prefetch[workflow_id] = self._prefetch_executor.submit(self.__prefetch_first_page, workflow_id)
+
+    def __prefetch_first_page(self, workflow_id):
+        """
+        Fetches the first page of runs of a workflow for `prefetch_workflow_runs`.
+
+        Args:
+            workflow_id (int): The ID of the workflow.
+
+        Returns:
+            tuple: The time of the fetch and the parsed first page as returned by `_parse_runs_page`.
+            None: If the request failed, in which case the page is fetched again when it is needed.
+        """
+        # Prefetches neither wait for nor repeat rate limited requests, the page is fetched when needed instead
+        if self._rate_limited_until > time.time():
+            return None
+        try:
+            _, page = self.__fetch_runs_page(workflow_id, 1, retry_rate_limited=False)
+        except Exception:
+            return None
+        return None if page is None else (time.monotonic(), page)
+
+    def close(self):
+        """
+        Cancels outstanding prefetches, ends pending rate limit waits and closes the HTTP session.
+        """
+        self._closed.set()
+        for future in self._prefetch.values():
+            future.cancel()
+        self._prefetch.clear()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+        if "session" in self.__dict__:
+            self.session.close()
+
+    def __fetch_runs_page(self, workflow_id, page, retry_rate_limited=True):
+        """
+        Fetches one page of runs of a workflow through the ETag cache.
+
+        Args:
+            workflow_id (int): The ID of the workflow.
+            page (int): The number of the page to fetch.
+            retry_rate_limited (bool): Whether to wait for and repeat rate limited requests. Defaults to True.
+
+        Returns:
+            tuple: The response and the parsed page as returned by `_parse_runs_page`, or None as page
+                   if the request failed.
+        """
+        url = f"{self._workflows_url}/{workflow_id}/runs"
+        # Only four fields per run are used, so skip the pull request objects embedded in every run
+        params = {"per_page": 100, "page": page, "exclude_pull_requests": "true"}
+        return self.__conditional_get(
+            (workflow_id, page), url, _parse_runs_page, params=params, retry_rate_limited=retry_rate_limited
+        )
+
+    def __fetch_workflow_runs(self, workflow_id, prefetched=None):
+        """
+        Fetches all runs for a specific workflow, using the runs cache while it is fresh.
+
+        Args:
+            workflow_id (int): The ID of the workflow.
+            prefetched (tuple): The result of `__prefetch_first_page`, reused while it is fresh.
+
+        Returns:
+            list: A list of tuples containing run ID, name, creation date, and status, sorted by name.
+        """
+        cached = self._runs_cache.get(workflow_id)
+        if cached and time.monotonic() - cached[0] < RUNS_CACHE_TTL:
+            return list(cached[1])
+
+        # The first page links to the last one, so the remaining pages can be fetched at once
+        if prefetched is not None and time.monotonic() - prefetched[0] < RUNS_CACHE_TTL:
+            first_page = prefetched[1]
+        else:
+            response, first_page = self.__fetch_runs_page(workflow_id, 1)
+            if first_page is None:
                 click.echo(f"Failed to fetch workflow runs: {response.text}")
-                break
+                return []
 
-            data = response.json()["workflow_runs"]
-            if not data:
-                break
+        last_page, runs = first_page
+        runs = list(runs)
+        complete = True
+
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                pages = executor.map(functools.partial(self.__fetch_runs_page, workflow_id), range(2, last_page + 1))
+                for response, page in pages:
+                    if page is None:
+                        click.echo(f"Failed to fetch workflow runs: {response.text}")
+                        complete = False
+                        break
+                    runs.extend(page[1])
 
-            runs.extend([(run["id"], run["name"], run["created_at"], run["status"]) for run in data])
-            page += 1
+        # Sort once here so listings served from the cache are already in menu order
+        runs.sort(key=lambda run: run[1].lower())
 
-        return runs
+        # Incomplete listings are returned but not cached
+        if complete:
+            self._runs_cache[workflow_id] = (time.monotonic(), runs)
+        return list(runs)
 
     def delete_workflow_run(self, run_id):
         """
@@ -129,11 +632,41 @@ class GitHubWorkflowManager:
         Returns:
             bool: True if the deletion was successful, False otherwise.
         """
-        headers = {"Authorization": f"Bearer {self.token}"}
-        url = f"{self.github_api_url}/repos/{self.repo}/actions/runs/{run_id}"
-        response = requests.delete(url, headers=headers)
+        deleted = self.__delete_run(run_id)
+        if deleted:
+            self.__invalidate_runs({run_id})
+        return deleted
+
+    def __delete_run(self, run_id):
+        """
+        Deletes a workflow run without touching the runs cache, which bulk deletes invalidate once at the end.
+
+        Args:
+            run_id (int): The ID of the workflow run to delete.
+
+        Returns:
+            bool: True if the deletion was successful, False otherwise.
+        """
+        import requests
+
+        try:
+            response = self.__request("DELETE", f"{self._actions_url}/runs/{run_id}")
+        except requests.RequestException:
+            # e.g. a connection error after the retries ran out; reported like any other failed delete
+            return False
         return response.status_code == 204
 
+    def __invalidate_runs(self, run_ids):
+        """
+        Drops the cached listings of the workflows that contained any of the given runs.
+
+        Args:
+            run_ids (set): The IDs of the deleted workflow runs.
+        """
+        for workflow_id, (_, runs) in list(self._runs_cache.items()):
+            if any(run[0] in run_ids for run in runs):
+                self._runs_cache.pop(workflow_id, None)
+
     def delete_all_runs(self, workflow_id):
         """
         Deletes all runs for a specific workflow.
@@ -146,11 +679,32 @@ class GitHubWorkflowManager:
             click.echo("No workflow runs found for this workflow.")
             return
 
-        for run_id, _, _, _ in runs:
-            if self.delete_workflow_run(run_id):
-                click.echo(f"Deleted workflow run ID {run_id}.")
-            else:
-                click.echo(f"Failed to delete workflow run ID {run_id}.")
+        self.delete_workflow_runs([run_id for run_id, _, _, _ in runs])
+
+    def delete_workflow_runs(self, run_ids):
+        """
+        Deletes multiple workflow runs concurrently.
+
+        Args:
+            run_ids (list): The IDs of the workflow runs to delete.
+        """
+        failures = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(self.__delete_run, run_id): run_id for run_id in run_ids}
+            with click.progressbar(length=len(run_ids), label="Deleting workflow runs", show_pos=True) as bar:
+                # Advance as soon as any delete finishes instead of waiting for them in submission order
+                for future in as_completed(futures):
+                    if not future.result():
+                        failures.append(futures[future])
+                    bar.update(1)
+
+        # The deleted runs are gone, so cached listings of their workflows are outdated
+        self.__invalidate_runs(set(run_ids).difference(failures))
+
+        # Report one summary instead of a line per run
+        click.echo(f"{len(run_ids) - len(failures)}/{len(run_ids)} deleted; {len(failures)} failed")
+        if failures:
+            click.echo(f"Failed to delete workflow run IDs: {', '.join(map(str, sorted(failures)))}")
 
     def run_fzf_selection(self, items, prompt="Select an item"):
         """
@@ -163,12 +717,27 @@ class GitHubWorkflowManager:
         Returns:
             list: A list of selected items.
         """
-        input_items = "\n".join(items)
         process = subprocess.Popen(
             ['fzf', '--multi', '--bind', 'space:toggle', '--preview', 'echo {}', '--prompt', prompt],
-            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1024 * 1024
         )
-        output, _ = process.communicate(input=input_items.encode('utf-8'))
+
+        def write_items():
+            # Stream the items so fzf can start filtering before the whole menu has been written
+            try:
+                for item in items:
+                    process.stdin.write(item.encode('utf-8'))
+                    process.stdin.write(b"\n")
+                process.stdin.close()
+            except BrokenPipeError:
+                # fzf exits as soon as a selection is made, possibly before all items were written
+                pass
+
+        writer = threading.Thread(target=write_items, daemon=True)
+        writer.start()
+        output = process.stdout.read()
+        process.wait()
+        writer.join()
         selected_items = output.decode('utf-8').splitlines()
         click.echo(f"\n{len(selected_items)} items selected.")  # Feedback on how many were selected
         return selected_items